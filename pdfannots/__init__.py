@@ -6,8 +6,11 @@ __version__ = '0.2'
 
 import bisect
 import collections
+import gc
+import importlib.util
 import itertools
 import logging
+import os
 import typing
 
 from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
@@ -22,11 +25,23 @@ from pdfminer import pdftypes
 import pdfminer.settings
 import pdfminer.utils
 
-from .types import Page, Outline, AnnotationType, Annotation, Document
-from .utils import cleanup_text, decode_datetime, format_alpha, format_roman
+from .types import Box, Page, Outline, AnnotationType, Annotation, Document
+from .utils import cleanup_text, decode_datetime, decode_text, format_alpha, format_roman
 
 pdfminer.settings.STRICT = False
 
+if typing.TYPE_CHECKING:
+    import concurrent.futures
+    import rtree.index
+
+# Optional dependencies, used to speed up hit-testing of characters against annotation boxes:
+# numpy to vectorize it, numba (with numpy) to compile it, and (without numpy) rtree to index
+# pages with many boxes. They are slow to import, so here we only check that they are installed,
+# and import them where they are used (and only when worthwhile).
+HAVE_NUMPY = importlib.util.find_spec('numpy') is not None
+HAVE_NUMBA = HAVE_NUMPY and importlib.util.find_spec('numba') is not None
+HAVE_RTREE = importlib.util.find_spec('rtree') is not None
+
 logger = logging.getLogger(__name__)
 
 ANNOT_SUBTYPES: typing.Dict[PSLiteral, AnnotationType] = {
@@ -41,6 +56,31 @@ IGNORED_ANNOT_SUBTYPES = \
     ))
 """Annotation types that we ignore without issuing a warning."""
 
+NUMPY_MIN_BOXES = 8
+"""
+Minimum number of annotation boxes on a page for which we hit-test them with numpy (if available).
+For each character, a Python loop costs about 2us per box, and numpy about 6us regardless of the
+number of boxes, plus about 60ms to import numpy in the first place. With fewer boxes, the loop is
+about as fast, and avoids the import.
+"""
+
+NUMBA_MIN_HIT_TESTS = 50000
+"""
+Number of characters that a process must hit-test with numpy before we compile the hit-test with
+numba (if available), for subsequent pages. Compared to numpy, this saves about 5us per character,
+but importing numba and loading the compiled code costs about 0.3s, so it only pays off after some
+tens of thousands of characters. Until then, the cost of using numpy is at most that of numba.
+"""
+
+RTREE_MIN_BOXES = 32
+"""
+Minimum number of annotation boxes on a page for which we build a spatial index (if rtree is
+available, and numpy is not). With fewer boxes, a linear scan is faster.
+"""
+
+_GOTO = PSLiteralTable.intern('GoTo')
+_XYZ = PSLiteralTable.intern('XYZ')
+
 
 def _mkannotation(
     pa: typing.Dict[str, typing.Any],
@@ -54,13 +94,8 @@ def _mkannotation(
     """
 
     subtype = pa.get('Subtype')
-    annot_type = None
     assert isinstance(subtype, PSLiteral)
-    try:
-        annot_type = ANNOT_SUBTYPES[subtype]
-    except KeyError:
-        pass
-
+    annot_type = ANNOT_SUBTYPES.get(subtype)
     if annot_type is None:
         if subtype not in IGNORED_ANNOT_SUBTYPES:
             logger.warning("Unsupported %s annotation ignored on %s", subtype.name, page)
@@ -69,7 +104,7 @@ def _mkannotation(
     contents = pa.get('Contents')
     if contents is not None:
         # decode as string, normalise line endings, replace special characters
-        contents = cleanup_text(pdfminer.utils.decode_text(contents))
+        contents = cleanup_text(decode_text(contents))
 
     # Rect defines the location of the annotation on the page
     rect = pdftypes.resolve1(pa.get('Rect'))
@@ -80,7 +115,7 @@ def _mkannotation(
 
     author = pdftypes.resolve1(pa.get('T'))
     if author is not None:
-        author = pdfminer.utils.decode_text(author)
+        author = decode_text(author)
 
     created = None
     dobj = pa.get('CreationDate')
@@ -90,7 +125,7 @@ def _mkannotation(
     dobj = dobj or pa.get('M')
     createds = pdftypes.resolve1(dobj)
     if createds is not None:
-        createds = pdfminer.utils.decode_text(createds)
+        createds = decode_text(createds)
         created = decode_datetime(createds)
 
     return Annotation(page, annot_type, quadpoints, rect,
@@ -100,11 +135,15 @@ def _mkannotation(
 def _get_outlines(doc: PDFDocument) -> typing.Iterator[Outline]:
     """Retrieve a list of (unresolved) Outline objects for all recognised outlines in the PDF."""
 
+    # Named destinations resolved so far. Many outlines may share the same target.
+    named_dests: typing.Dict[typing.Any, typing.Any] = {}
+
     def _resolve_dest(dest: typing.Any) -> typing.Any:
-        if isinstance(dest, bytes):
-            dest = pdftypes.resolve1(doc.get_dest(dest))
-        elif isinstance(dest, PSLiteral):
-            dest = pdftypes.resolve1(doc.get_dest(dest.name))
+        if isinstance(dest, (bytes, PSLiteral)):
+            name = dest.name if isinstance(dest, PSLiteral) else dest
+            if name not in named_dests:
+                named_dests[name] = pdftypes.resolve1(doc.get_dest(name))
+            dest = named_dests[name]
         if isinstance(dest, dict):
             dest = dest['D']
         return dest
@@ -114,14 +153,14 @@ def _get_outlines(doc: PDFDocument) -> typing.Iterator[Outline]:
             action = pdftypes.resolve1(actionref)
             if isinstance(action, dict):
                 subtype = action.get('S')
-                if subtype is PSLiteralTable.intern('GoTo'):
+                if subtype is _GOTO:
                     destname = action.get('D')
         if destname is None:
             continue
         dest = _resolve_dest(destname)
 
         # consider targets of the form [page /XYZ left top zoom]
-        if dest[1] is PSLiteralTable.intern('XYZ'):
+        if dest[1] is _XYZ:
             (pageref, _, targetx, targety) = dest[:4]
 
             if isinstance(pageref, (int, pdftypes.PDFObjRef)):
@@ -187,7 +226,7 @@ def _get_page_labels(doc: PDFDocument) -> typing.Iterator[str]:
 
         d = label_dicts[i]
         style = d.get('S')
-        prefix = pdfminer.utils.decode_text(pdftypes.str_value(d.get('P', b'')))
+        prefix = decode_text(pdftypes.str_value(d.get('P', b'')))
         first = pdftypes.int_value(d.get('St', 1))
 
         for value in range(first, first + range_limit - range_start):
@@ -207,6 +246,93 @@ def _get_page_labels(doc: PDFDocument) -> typing.Iterator[str]:
             yield prefix + label
 
 
+_failed_imports: typing.Set[str] = set()
+"""Optional dependencies that are installed, but failed to import (so we stop trying)."""
+
+
+def _import_optional(name: str) -> bool:
+    """
+    Import an optional dependency, returning whether it succeeded.
+
+    An installed package may still fail to import, e.g. if it was built against an incompatible
+    version of a library, or (for rtree) its native library is missing. This is logged once.
+    """
+    if name in _failed_imports:
+        return False
+    try:
+        importlib.import_module(name)
+    except (ImportError, OSError) as e:
+        logger.warning("Failed to import %s: %s", name, e)
+        _failed_imports.add(name)
+        return False
+    return True
+
+
+# Types of numpy arrays (left as Any, since numpy is optional).
+_FloatArray = typing.Any  # 1-D array of numpy.float64
+_IndexArray = typing.Any  # 1-D array of numpy.intp
+
+
+def _hit_indices(
+    x0: _FloatArray,
+    y0: _FloatArray,
+    x1: _FloatArray,
+    y1: _FloatArray,
+    annot_idx: _IndexArray,
+    ix0: float,
+    iy0: float,
+    ix1: float,
+    iy1: float,
+    item_area: float,
+    out: _IndexArray
+) -> int:
+    """
+    Find the boxes covering most of an item's area, as per Box.hit_item.
+
+    The boxes are given as a structure of arrays. For each box hit, its annotation index is
+    stored in out, which must be at least as long as the arrays. Returns the number stored.
+    """
+    n = 0
+    for i in range(x0.shape[0]):
+        x_overlap = min(x1[i], ix1) - max(x0[i], ix0)
+        y_overlap = min(y1[i], iy1) - max(y0[i], iy0)
+        if x_overlap > 0 and y_overlap > 0 and x_overlap * y_overlap >= 0.5 * item_area:
+            out[n] = annot_idx[i]
+            n += 1
+    return n
+
+
+_hit_indices_jit: typing.Optional[typing.Callable[..., int]] = None
+
+_vectorized_hit_tests = 0
+"""Number of characters hit-tested with numpy so far in this process."""
+
+
+def _get_hit_indices_jit() -> typing.Optional[typing.Callable[..., int]]:
+    """
+    Return _hit_indices compiled with numba, importing numba on the first call.
+
+    Returns None if numba is installed but fails to import, or cannot cache compiled code.
+    """
+    global _hit_indices_jit
+    if _hit_indices_jit is None and _import_optional('numba'):
+        import numba
+        try:
+            # Cache the compiled code on disk, to avoid compiling again on subsequent runs.
+            _hit_indices_jit = numba.njit(cache=True, nogil=True)(_hit_indices)
+        except OSError as e:
+            logger.warning("Failed to compile with numba: %s", e)
+            _failed_imports.add('numba')
+    return _hit_indices_jit
+
+
+_RenderStack = typing.Deque[typing.Optional[LTItem]]
+"""Stack of layout items pending a visit by _PDFProcessor.render. None marks a text box's end."""
+
+_RenderHandler = typing.Callable[["_PDFProcessor", typing.Any, _RenderStack], None]
+"""Method of _PDFProcessor that handles one type of layout item during rendering."""
+
+
 class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
     # (pdfminer lacks type annotations)
     """
@@ -224,16 +350,53 @@ class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
     charseq: int                    # Character sequence number within the page.
     compseq: int                    # Component sequence number within the page.
     recent_text: typing.Deque[str]  # Rotating buffer of recent text, for context.
-    _lasthit: typing.FrozenSet[Annotation]  # Annotations hit by the most recent character.
-    _curline: typing.Set[Annotation]        # Annotations hit somewhere on the current line.
+
+    # Sets of annotations are represented as bitmasks, where bit i corresponds to page.annots[i].
+    _lasthit: int  # Annotations hit by the most recent character.
+    _curline: int  # Annotations hit somewhere on the current line.
+
+    # State used to infer lines of text in fast layout mode.
+    fast_laparams: typing.Optional[LAParams]       # Layout parameters used in fast layout mode.
+    _prevchar: typing.Optional[LTChar]             # The most recent character.
+    _linebox: typing.Optional[typing.List[float]]  # Bounding box [x0, y0, x1, y1] of current line.
+
+    # Method used by test_boxes to hit-test an item against the page's annotation boxes,
+    # chosen by set_page: one of _test_boxes_indexed, _test_boxes_vectorized or _test_boxes_loop.
+    _test_boxes_impl: typing.Callable[[LTComponent], int]
+
+    # For pages with many boxes, when numpy is available, the boxes of all annotations are flattened
+    # into a structure of arrays (one array per coordinate), which are swept in a single pass.
+    _box_x0: _FloatArray
+    _box_y0: _FloatArray
+    _box_x1: _FloatArray
+    _box_y1: _FloatArray
+    _box_annot_idx: _IndexArray  # Maps each box to the index of its annotation in page.annots.
+    _hit_scratch: _IndexArray    # Output buffer for _hit_indices, with one entry per box.
+    _hit_indices_fn: typing.Optional[typing.Callable[..., int]]  # Compiled _hit_indices, or None.
+
+    # Otherwise, if rtree is available, an R-tree spatial index of the boxes, whose IDs are indices
+    # into _indexed_boxes. Each entry there is a box and the index of its annotation in page.annots.
+    _rtree: "rtree.index.Index"
+    _indexed_boxes: typing.List[typing.Tuple[Box, int]]
 
     # Stores annotations that are subscribed to receive their post-annotation
     # context. The first element of each tuple, on which the list is sorted, is
     # the sequence number of the last character to hit the annotation.
     context_subscribers: typing.List[typing.Tuple[int, Annotation]]
 
-    def __init__(self, rsrcmgr: PDFResourceManager, laparams: LAParams):
-        super().__init__(rsrcmgr, laparams=laparams)
+    # Render handlers, keyed by the concrete type of layout item. Populated lazily by render().
+    _render_dispatch: typing.Dict[typing.Type[LTItem], _RenderHandler] = {}
+
+    def __init__(
+        self,
+        rsrcmgr: PDFResourceManager,
+        laparams: LAParams,
+        fast_layout: bool = False
+    ):
+        # In fast layout mode, we disable pdfminer's layout analysis, and instead infer lines and
+        # word breaks ourselves, using only the line_overlap and word_margin parameters.
+        super().__init__(rsrcmgr, laparams=(None if fast_layout else laparams))
+        self.fast_laparams = laparams if fast_layout else None
         self.page = None
         self.recent_text = collections.deque(maxlen=self.CONTEXT_CHARS)
         self.context_subscribers = []
@@ -245,14 +408,52 @@ class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
         self.compseq = 0
         self.recent_text.clear()
         self.context_subscribers.clear()
-        self._lasthit = frozenset()
-        self._curline = set()
+        self._lasthit = 0
+        self._curline = 0
+        self._prevchar = None
+        self._linebox = None
 
     def set_page(self, page: Page) -> None:
         """Prepare to process a new page. Must be called prior to processing."""
         assert self.page is None
         self.page = page
 
+        # Choose how to hit-test characters against the annotation boxes on this page.
+        # Hit-testing with numpy is faster than using the spatial index, for any number of boxes.
+        nboxes = sum(len(a.boxes) for a in page.annots)
+        if HAVE_NUMPY and nboxes >= NUMPY_MIN_BOXES and _import_optional('numpy'):
+            self._prepare_vectorized(
+                use_numba=(HAVE_NUMBA and _vectorized_hit_tests >= NUMBA_MIN_HIT_TESTS))
+        elif HAVE_RTREE and nboxes >= RTREE_MIN_BOXES and _import_optional('rtree.index'):
+            self._prepare_indexed()
+        else:
+            self._test_boxes_impl = self._test_boxes_loop
+
+    def _prepare_vectorized(self, use_numba: bool) -> None:
+        """Hit-test the page's boxes with numpy (and if requested and available, numba)."""
+        import numpy
+        assert self.page is not None
+        annots = self.page.annots
+        coords = [(b.x0, b.y0, b.x1, b.y1) for a in annots for b in a.boxes]
+        boxes = numpy.array(coords, dtype=numpy.float64).reshape(len(coords), 4)
+        self._box_x0, self._box_y0, self._box_x1, self._box_y1 = (
+            numpy.ascontiguousarray(boxes[:, i]) for i in range(4))
+        self._box_annot_idx = numpy.array(
+            [i for (i, a) in enumerate(annots) for _ in a.boxes], dtype=numpy.intp)
+        self._hit_scratch = numpy.empty(len(coords), dtype=numpy.intp)
+        self._hit_indices_fn = _get_hit_indices_jit() if use_numba else None
+        self._test_boxes_impl = self._test_boxes_vectorized
+
+    def _prepare_indexed(self) -> None:
+        """Hit-test the page's boxes using a spatial index built with rtree."""
+        import rtree.index
+        assert self.page is not None
+        annots = self.page.annots
+        self._indexed_boxes = [(b, i) for (i, a) in enumerate(annots) for b in a.boxes]
+        self._rtree = rtree.index.Index(
+            (boxid, b.get_coords(), None) for (boxid, (b, _)) in enumerate(self._indexed_boxes))
+        self._test_boxes_impl = self._test_boxes_indexed
+
     def receive_layout(self, ltpage: LTPage) -> None:
         """Callback from PDFLayoutAnalyzer superclass. Called once with each laid-out page."""
         assert self.page is not None
@@ -262,6 +463,8 @@ class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
 
         # Render all the items on the page
         self.render(ltpage)
+        if self._linebox is not None:
+            self.end_inferred_line()
 
         # If we still have annotations needing context, give them whatever we have
         for (charseq, annot) in self.context_subscribers:
@@ -281,10 +484,63 @@ class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
     def test_boxes(self, item: LTComponent) -> None:
         """Update the set of annotations whose boxes intersect with the area of the given item."""
         assert self.page is not None
-        hits = frozenset(a for a in self.page.annots if a.boxes
-                         and any(b.hit_item(item) for b in a.boxes))
+        hits = self._test_boxes_impl(item)
         self._lasthit = hits
-        self._curline.update(hits)
+        self._curline |= hits
+
+    def _test_boxes_loop(self, item: LTComponent) -> int:
+        """Call Box.hit_item for every annotation box."""
+        assert self.page is not None
+        hits = 0
+        for (i, a) in enumerate(self.page.annots):
+            if a.boxes and any(b.hit_item(item) for b in a.boxes):
+                hits |= 1 << i
+        return hits
+
+    def _test_boxes_indexed(self, item: LTComponent) -> int:
+        """Call Box.hit_item for every annotation box that the spatial index says may overlap."""
+        hits = 0
+        for boxid in self._rtree.intersection((item.x0, item.y0, item.x1, item.y1)):
+            (box, i) = self._indexed_boxes[boxid]
+            if box.hit_item(item):
+                hits |= 1 << i
+        return hits
+
+    def _test_boxes_vectorized(self, item: LTComponent) -> int:
+        """Equivalent to calling Box.hit_item for every annotation box, using numpy."""
+        item_area = float(item.width) * float(item.height)
+        if item_area == 0 or self._box_annot_idx.size == 0:
+            return 0
+
+        if self._hit_indices_fn is not None:
+            n = self._hit_indices_fn(self._box_x0, self._box_y0, self._box_x1, self._box_y1,
+                                     self._box_annot_idx, item.x0, item.y0, item.x1, item.y1,
+                                     item_area, self._hit_scratch)
+            hit_indices = self._hit_scratch[:n].tolist()
+        else:
+            global _vectorized_hit_tests
+            _vectorized_hit_tests += 1
+            import numpy
+            x_overlap = (numpy.minimum(self._box_x1, item.x1)
+                         - numpy.maximum(self._box_x0, item.x0))
+            y_overlap = (numpy.minimum(self._box_y1, item.y1)
+                         - numpy.maximum(self._box_y0, item.y0))
+            overlap_area = numpy.maximum(x_overlap, 0) * numpy.maximum(y_overlap, 0)
+            hit_indices = self._box_annot_idx[overlap_area >= (0.5 * item_area)].tolist()
+
+        hits = 0
+        for i in hit_indices:
+            hits |= 1 << i
+        return hits
+
+    def _iter_annots(self, mask: int) -> typing.Iterator[Annotation]:
+        """Iterate over the annotations in a bitmask, in page.annots order."""
+        assert self.page is not None
+        annots = self.page.annots
+        while mask:
+            lowbit = mask & -mask
+            yield annots[lowbit.bit_length() - 1]
+            mask ^= lowbit
 
     def capture_context(self, text: str) -> None:
         """Store the character for use as context, and update subscribers if required."""
@@ -307,10 +563,13 @@ class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
         assert text != '\n'
         self.capture_context(text)
 
-        # Broadcast the character to annotations that include it.
-        for a in self._lasthit:
+        # Broadcast the character to annotations that include it (if any; usually there are none).
+        if not self._lasthit:
+            return
+        charseq = self.charseq
+        for a in self._iter_annots(self._lasthit):
             last_charseq = a.last_charseq
-            a.capture(text, self.charseq)
+            a.capture(text, charseq)
 
             if a.wants_context():
                 if a.has_context():
@@ -332,7 +591,7 @@ class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
                     a.set_pre_context(pre_context)
 
                 # Subscribe this annotation for post-context.
-                self.context_subscribers.append((self.charseq, a))
+                self.context_subscribers.append((charseq, a))
 
     def capture_newline(self) -> None:
         """
@@ -343,69 +602,254 @@ class _PDFProcessor(PDFLayoutAnalyzer):  # type:ignore
         most recent character on the line was not covered by their boxes.
         """
         self.capture_context('\n')
-        for a in self._curline:
+        for a in self._iter_annots(self._curline):
             a.capture('\n')
-        self._curline = set()
+        self._curline = 0
+
+    def infer_layout(self, item: LTChar) -> None:
+        """
+        Infer line and word breaks prior to the given character, in lieu of layout analysis.
+
+        This is a crude substitute for pdfminer's layout analysis, used in fast layout mode. A
+        character that does not sufficiently overlap the vertical extent of its predecessor (as
+        per line_overlap) begins a new line. On the same line, a gap wider than the word margin
+        implies a space between words.
+        """
+        laparams = self.fast_laparams
+        assert laparams is not None
+        prev = self._prevchar
+        self._prevchar = item
+
+        if (prev is not None and self._linebox is not None
+                and prev.voverlap(item) > min(prev.height, item.height) * laparams.line_overlap):
+            # Continuing the current line.
+            if (item.x0 - prev.x1 > max(prev.width, prev.height) * laparams.word_margin
+                    and not prev.get_text().isspace() and not item.get_text().isspace()):
+                # Like an LTAnno, the implied space is attributed to the preceding character.
+                self.capture_char(' ')
+
+            box = self._linebox
+            box[0] = min(box[0], item.x0)
+            box[1] = min(box[1], item.y0)
+            box[2] = max(box[2], item.x1)
+            box[3] = max(box[3], item.y1)
+        else:
+            # Starting a new line.
+            if self._linebox is not None:
+                self.end_inferred_line()
+            self._linebox = [item.x0, item.y0, item.x1, item.y1]
+
+    def end_inferred_line(self) -> None:
+        """Finish the current line of text inferred in fast layout mode."""
+        assert self._linebox is not None
+        x0, y0, x1, y1 = self._linebox
+        self._linebox = None
+        self.update_pageseq(LTComponent((x0, y0, x1, y1)))
+        self.capture_newline()
 
     def render(self, item: LTItem) -> None:
         """
-        Helper for receive_layout, called recursively for every item on a page, in layout order.
+        Helper for receive_layout, called once per page to visit every item, in layout order.
+
+        The layout tree is traversed depth-first using an explicit stack rather than recursion,
+        and each item is dispatched to a handler method looked up by its concrete type.
 
         Ref: https://pdfminersix.readthedocs.io/en/latest/topic/converting_pdf_to_text.html
         """
+        # Bind frequently-used lookups to locals, outside the loop.
+        dispatch = self._render_dispatch
+        get_handler = dispatch.get
+        capture_newline = self.capture_newline
+
+        stack: _RenderStack = collections.deque([item])
+        pop = stack.pop
+        while stack:
+            top = pop()
+            if top is None:
+                # After the children of a text box, capture the end of the final
+                # line (logic derived from pdfminer.converter.TextConverter).
+                capture_newline()
+                continue
+
+            itemtype = type(top)
+            handler = get_handler(itemtype)
+            if handler is None:
+                handler = dispatch[itemtype] = self._lookup_render_handler(itemtype)
+            handler(self, top, stack)
+
+    @staticmethod
+    def _lookup_render_handler(itemtype: typing.Type[LTItem]) -> _RenderHandler:
+        """Determine the render handler for a given (concrete) type of layout item."""
+        if issubclass(itemtype, (LTTextLine, LTFigure)):
+            return _PDFProcessor._render_sequenced
+        elif issubclass(itemtype, LTTextBox):
+            return _PDFProcessor._render_textbox
+        elif issubclass(itemtype, LTContainer):
+            return _PDFProcessor._render_container
+        elif issubclass(itemtype, LTChar):
+            return _PDFProcessor._render_char
+        elif issubclass(itemtype, LTAnno):
+            return _PDFProcessor._render_anno
+        else:
+            return _PDFProcessor._render_ignored
+
+    def _render_container(self, item: typing.Iterable[LTItem], stack: _RenderStack) -> None:
+        # Visit nested items next, in order.
+        stack.extend(reversed(list(item)))
+
+    def _render_sequenced(self, item: "LTContainer[LTItem]", stack: _RenderStack) -> None:
         # Assign sequence numbers to items on the page based on their proximity to lines of text or
         # to figures (which may contain bare LTChar elements).
-        if isinstance(item, (LTTextLine, LTFigure)):
-            self.update_pageseq(item)
+        self.update_pageseq(item)
+        self._render_container(item, stack)
 
-        # If it's a container, recurse on nested items.
-        if isinstance(item, LTContainer):
-            for child in item:
-                self.render(child)
-
-            # After the children of a text box, capture the end of the final
-            # line (logic derived from pdfminer.converter.TextConverter).
-            if isinstance(item, LTTextBox):
-                self.capture_newline()
+    def _render_textbox(self, item: LTTextBox, stack: _RenderStack) -> None:
+        # Schedule a newline at the end of the box, to be visited after its children.
+        stack.append(None)
+        self._render_container(item, stack)
 
+    def _render_char(self, item: LTChar, stack: _RenderStack) -> None:
         # Each character is represented by one LTChar, and we must handle
         # individual characters (not higher-level objects like LTTextLine)
         # so that we can capture only those covered by the annotation boxes.
-        elif isinstance(item, LTChar):
-            self.test_boxes(item)
-            self.capture_char(item.get_text())
+        if self.fast_laparams is not None:
+            self.infer_layout(item)
+        self.test_boxes(item)
+        self.capture_char(item.get_text())
 
+    def _render_anno(self, item: LTAnno, stack: _RenderStack) -> None:
         # LTAnno objects capture whitespace not explicitly encoded in
         # the text. They don't have an (X,Y) position -- we treat them
         # the same as the most recent character.
-        elif isinstance(item, LTAnno):
-            text = item.get_text()
-            if text == '\n':
-                self.capture_newline()
-            else:
-                self.capture_char(text)
+        text = item.get_text()
+        if text == '\n':
+            self.capture_newline()
+        else:
+            self.capture_char(text)
 
+    def _render_ignored(self, item: LTItem, stack: _RenderStack) -> None:
+        pass
 
-def process_file(
+
+def _process_page(
+    device: _PDFProcessor,
+    interpreter: PDFPageInterpreter,
+    pdfpage: PDFPage,
+    page: Page
+) -> None:
+    """Construct the annotations for a page, then render it (if needed) to capture their text."""
+
+    # Construct Annotation objects, and append them to the page.
+    for pa in pdftypes.resolve1(pdfpage.annots) if pdfpage.annots else []:
+        if isinstance(pa, pdftypes.PDFObjRef):
+            annot = _mkannotation(pdftypes.dict_value(pa), page)
+            if annot is not None:
+                page.annots.append(annot)
+        else:
+            logger.warning("Unknown annotation: %s", pa)
+
+    # If the page has neither outlines nor annotations, skip further processing.
+    if not (page.annots or page.outlines):
+        return
+
+    # Render the page. This captures the selected text for any annotations
+    # on the page, and updates annotations and outlines with a logical
+    # sequence number based on the order of text lines on the page.
+    #
+    # Rendering allocates a great many objects (e.g. an LTChar for every character), which
+    # triggers frequent cyclic garbage collections that repeatedly scan the growing layout tree,
+    # yet frees very little. So we suspend the garbage collector while rendering.
+    device.set_page(page)
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        interpreter.process_page(pdfpage)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    # Now we have their logical order, sort the annotations and outlines. Sorting checks that
+    # each position was sequenced (see Pos.sort_key), so skip it for a lone item, which needs no
+    # sorting and may be unsequenced (e.g. a note on a page without text).
+    if len(page.annots) > 1:
+        page.annots.sort(key=Annotation.sort_key)
+    if len(page.outlines) > 1:
+        page.outlines.sort(key=Outline.sort_key)
+
+
+# Per-process state of a worker rendering pages for process_file: the path of the most recently
+# opened PDF, its open file handle, a resource manager, and its list of pages.
+_worker_doc: typing.Optional[
+    typing.Tuple[str, typing.BinaryIO, PDFResourceManager, typing.List[PDFPage]]] = None
+
+
+def _process_page_in_worker(
+    path: str,
+    pageno: int,
+    columns_per_page: typing.Optional[int],
+    laparams: LAParams,
+    fast_layout: bool,
+    outline_targets: typing.List[typing.Tuple[str, typing.Tuple[float, float]]]
+) -> Page:
+    """
+    Process one page of a PDF file, in a worker process.
+
+    The worker re-opens the file (keeping it open for subsequent pages of the same file), and
+    constructs and returns its own Page object, equivalent to that built by process_file. Outlines
+    on the page are given by (title, target) tuples, since their page references are not portable
+    between processes.
+    """
+    global _worker_doc
+
+    if _worker_doc is None or _worker_doc[0] != path:
+        if _worker_doc is not None:
+            _worker_doc[1].close()
+        file = open(path, 'rb')
+        doc = PDFDocument(PDFParser(file))
+        _worker_doc = (path, file, PDFResourceManager(), list(PDFPage.create_pages(doc)))
+
+    (_, _, rsrcmgr, pdfpages) = _worker_doc
+    pdfpage = pdfpages[pageno]
+    page = Page(pageno, pdfpage.pageid, pdfpage.mediabox, columns_per_page)
+
+    for (title, target) in outline_targets:
+        o = Outline(title, pageno, target)
+        o.resolve(page)
+        page.outlines.append(o)
+
+    device = _PDFProcessor(rsrcmgr, laparams, fast_layout)
+    _process_page(device, PDFPageInterpreter(rsrcmgr, device), pdfpage, page)
+    device.close()
+
+    return page
+
+
+MAX_PENDING_PAGES = 64
+"""Maximum number of pages that iter_pages may have queued for rendering by an executor."""
+
+
+def iter_pages(
     file: typing.BinaryIO,
+    document: Document,
     *,  # Subsequent arguments are keyword-only
     columns_per_page: typing.Optional[int] = None,
     emit_progress_to: typing.Optional[typing.TextIO] = None,
-    laparams: LAParams = LAParams()
-) -> Document:
+    laparams: LAParams = LAParams(),
+    fast_layout: bool = False,
+    executor: typing.Optional["concurrent.futures.ProcessPoolExecutor"] = None
+) -> typing.Iterator[Page]:
     """
-    Process a PDF file, extracting its annotations and outlines.
+    Process a PDF file incrementally, extracting its annotations and outlines.
 
-    Arguments:
-        file                Handle to PDF file
-        columns_per_page    If set, overrides PDF Miner's layout detect with a fixed page layout
-        emit_progress_to    If set, file handle (e.g. sys.stderr) to which progress is reported
-        laparams            PDF Miner layout parameters
+    Each page is appended to the given (initially empty) document, and then yielded, as soon as
+    it is complete. Pages are yielded in order, so when a page is yielded, the document contains
+    it and all prior pages. See process_file for a description of the other arguments.
     """
+    assert document.pages == []
 
     # Initialise PDFMiner state
     rsrcmgr = PDFResourceManager()
-    device = _PDFProcessor(rsrcmgr, laparams)
+    device = _PDFProcessor(rsrcmgr, laparams, fast_layout)
     interpreter = PDFPageInterpreter(rsrcmgr, device)
     parser = PDFParser(file)
     doc = PDFDocument(parser)
@@ -417,19 +861,33 @@ def process_file(
 
     emit_progress(file.name)
 
+    # Pages can only be rendered by the executor's workers if they can open the file themselves.
+    path = None
+    if executor is not None:
+        # Workers keep per-process state (see _process_page_in_worker), so they must not share
+        # a process with each other or with us.
+        import concurrent.futures
+        if not isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            raise TypeError("executor must be a ProcessPoolExecutor, not %s"
+                            % type(executor).__name__)
+        if isinstance(file.name, str) and os.path.isfile(file.name):
+            path = os.path.abspath(file.name)
+        else:
+            logger.info("Cannot render %s in parallel: not a regular file", file.name)
+
     # Step 1: retrieve outlines if present. Each outline refers to a page, using
     # *either* a PDF object ID or an integer page number. These references will
     # be resolved below while rendering pages -- for now we insert them into one
     # of two dicts for later.
-    outlines_by_pageno = collections.defaultdict(list)
-    outlines_by_objid = collections.defaultdict(list)
+    outlines_by_pageno: typing.Dict[int, typing.List[Outline]] = {}
+    outlines_by_objid: typing.Dict[typing.Any, typing.List[Outline]] = {}
 
     try:
         for o in _get_outlines(doc):
             if isinstance(o.pageref, pdftypes.PDFObjRef):
-                outlines_by_objid[o.pageref.objid].append(o)
+                outlines_by_objid.setdefault(o.pageref.objid, []).append(o)
             else:
-                outlines_by_pageno[o.pageref].append(o)
+                outlines_by_pageno.setdefault(o.pageref, []).append(o)
     except PDFNoOutlines:
         logger.info("Document doesn't include outlines (\"bookmarks\")")
     except Exception as ex:
@@ -438,13 +896,26 @@ def process_file(
     # Step 2: retrieve page labels, if present.
     page_labels: typing.Optional[typing.Iterator[str]] = _get_page_labels(doc)
 
+    # Pages not yet yielded, in order, each with the future result of rendering it in the executor
+    # (if any). A page rendered by the executor is replaced by the equivalent Page it returns.
+    pending: typing.Deque[
+        typing.Tuple[Page, typing.Optional["concurrent.futures.Future[Page]"]]] = \
+        collections.deque()
+
+    def complete_page() -> Page:
+        (page, future) = pending.popleft()
+        if future is not None:
+            rendered = future.result()
+            rendered.label = page.label
+            page = rendered
+        document.pages.append(page)
+        return page
+
     # Step 3: iterate over all the pages, constructing page objects.
-    result = Document()
     for (pageno, pdfpage) in enumerate(PDFPage.create_pages(doc)):
         emit_progress(" %d" % (pageno + 1))
 
         page = Page(pageno, pdfpage.pageid, pdfpage.mediabox, columns_per_page)
-        result.pages.append(page)
 
         # Retrieve the page's label, but stop trying after an exception is raised.
         if page_labels is not None:
@@ -458,33 +929,28 @@ def process_file(
 
         # Resolve any outlines referring to this page, and link them to the page.
         # Note that outlines may refer to the page number or ID.
-        for o in (outlines_by_objid.pop(page.objid, [])
-                  + outlines_by_pageno.pop(pageno, [])):
+        for o in itertools.chain(outlines_by_objid.pop(page.objid, ()),
+                                 outlines_by_pageno.pop(pageno, ())):
             o.resolve(page)
             page.outlines.append(o)
 
-        # Construct Annotation objects, and append them to the page.
-        for pa in pdftypes.resolve1(pdfpage.annots) if pdfpage.annots else []:
-            if isinstance(pa, pdftypes.PDFObjRef):
-                annot = _mkannotation(pdftypes.dict_value(pa), page)
-                if annot is not None:
-                    page.annots.append(annot)
-            else:
-                logger.warning("Unknown annotation: %s", pa)
-
-        # If the page has neither outlines nor annotations, skip further processing.
-        if not (page.annots or page.outlines):
-            continue
+        future = None
+        if executor is None or path is None:
+            _process_page(device, interpreter, pdfpage, page)
+        elif pdfpage.annots or page.outlines:
+            # Construct and render the page in a worker.
+            outline_targets = [(o.title, o.target) for o in page.outlines]
+            future = executor.submit(_process_page_in_worker, path, pageno, columns_per_page,
+                                     laparams, fast_layout, outline_targets)
+        pending.append((page, future))
 
-        # Render the page. This captures the selected text for any annotations
-        # on the page, and updates annotations and outlines with a logical
-        # sequence number based on the order of text lines on the page.
-        device.set_page(page)
-        interpreter.process_page(pdfpage)
+        # Yield pages that are complete, waiting on the executor only if too many are pending.
+        while pending and (pending[0][1] is None or pending[0][1].done()
+                           or len(pending) > MAX_PENDING_PAGES):
+            yield complete_page()
 
-        # Now we have their logical order, sort the annotations and outlines.
-        page.annots.sort()
-        page.outlines.sort()
+    while pending:
+        yield complete_page()
 
     emit_progress("\n")
 
@@ -494,4 +960,34 @@ def process_file(
     assert {} == outlines_by_pageno
     assert {} == outlines_by_objid
 
+
+def process_file(
+    file: typing.BinaryIO,
+    *,  # Subsequent arguments are keyword-only
+    columns_per_page: typing.Optional[int] = None,
+    emit_progress_to: typing.Optional[typing.TextIO] = None,
+    laparams: LAParams = LAParams(),
+    fast_layout: bool = False,
+    executor: typing.Optional["concurrent.futures.ProcessPoolExecutor"] = None
+) -> Document:
+    """
+    Process a PDF file, extracting its annotations and outlines.
+
+    Arguments:
+        file                Handle to PDF file
+        columns_per_page    If set, overrides PDF Miner's layout detect with a fixed page layout
+        emit_progress_to    If set, file handle (e.g. sys.stderr) to which progress is reported
+        laparams            PDF Miner layout parameters
+        fast_layout         If set, skips PDF Miner's layout analysis, in favour of a faster but
+                            cruder inference of lines and words from character positions
+        executor            If set, ProcessPoolExecutor used to render pages in parallel. Other
+                            executors (e.g. a ThreadPoolExecutor) are rejected with TypeError,
+                            since each worker process keeps its own state. Parallel rendering
+                            requires that the file has a name in the filesystem.
+    """
+    result = Document()
+    for _ in iter_pages(file, result, columns_per_page=columns_per_page,
+                        emit_progress_to=emit_progress_to, laparams=laparams,
+                        fast_layout=fast_layout, executor=executor):
+        pass
     return result
@@ -5,10 +5,11 @@ import typing
 
 from pdfminer.layout import LAParams
 
-from . import __doc__, __version__, process_file
+from . import __doc__, __version__, iter_pages
 from .printer import Printer
 from .printer.markdown import MarkdownPrinter, GroupedMarkdownPrinter
 from .printer.json import JsonPrinter
+from .types import Document
 
 
 MD_FORMAT_ARGS = ['print_filename', 'remove_hyphens', 'wrap_column', 'condense', 'sections']
@@ -45,6 +46,9 @@ def parse_args() -> typing.Tuple[argparse.Namespace, LAParams]:
                    help="When capturing text across a line break, don't attempt to remove hyphens.")
     g.add_argument("-f", "--format", choices=["md", "json"], default="md",
                    help="Output format (default: markdown).")
+    g.add_argument("-j", "--jobs", default=1, type=int, metavar="N",
+                   help="Render pages in parallel using N worker processes, or one per CPU if N "
+                        "is 0. The default (1) renders pages without starting any workers.")
 
     g = p.add_argument_group('Options controlling markdown output')
     g.add_argument("-s", "--sections", metavar="SEC", nargs="*",
@@ -106,9 +110,17 @@ def parse_args() -> typing.Tuple[argparse.Namespace, LAParams]:
         "--all-texts", default=laparams.all_texts,
         action="store_const", const=(not laparams.all_texts),
         help="Perform layout analysis on text in figures.")
+    g.add_argument(
+        "--fast-layout", default=False, action="store_true",
+        help="Skip PDFMiner's layout analysis, and instead infer lines and words from the "
+             "positions of consecutive characters. This is much faster, but less accurate; "
+             "of the options above, only --line-overlap and --word-margin apply.")
 
     args = p.parse_args()
 
+    if args.jobs < 0:
+        p.error("argument -j/--jobs: must not be negative")
+
     # Propagate parsed layout parameters back to LAParams object
     for param in ("line_overlap", "char_margin", "word_margin", "line_margin",
                   "boxes_flow", "detect_vertical", "all_texts"):
@@ -136,14 +148,28 @@ def main() -> None:
 
     write_if_nonempty(printer.begin())
 
+    # workers for rendering pages in parallel, shared by all the files
+    executor = None
+    if args.jobs != 1:
+        import concurrent.futures
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=(args.jobs or None))
+
     # iterate over files
-    for file in args.input:
-        doc = process_file(
-            file,
-            columns_per_page=args.cols,
-            emit_progress_to=(sys.stderr if args.progress else None),
-            laparams=laparams)
-        for line in printer.print_file(file.name, doc):
-            args.output.write(line)
+    try:
+        for file in args.input:
+            doc = Document()
+            pages = iter_pages(
+                file,
+                doc,
+                columns_per_page=args.cols,
+                emit_progress_to=(sys.stderr if args.progress else None),
+                laparams=laparams,
+                fast_layout=args.fast_layout,
+                executor=executor)
+            for line in printer.print_pages(file.name, doc, pages):
+                args.output.write(line)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     write_if_nonempty(printer.end())
@@ -1,7 +1,7 @@
 import abc
 import typing
 
-from ..types import Document
+from ..types import Document, Page
 
 
 class Printer(abc.ABC):
@@ -26,6 +26,24 @@ class Printer(abc.ABC):
         Called multiple times, once per file.
         """
 
+    def print_pages(
+        self,
+        filename: str,
+        document: Document,
+        pages: typing.Iterator[Page]
+    ) -> typing.Iterator[str]:
+        """
+        Pretty-print a single document, while it is being processed.
+
+        This is an alternative to print_file, called with an iterator over pages that are
+        appended to the document as they are processed (see pdfannots.iter_pages). The default
+        implementation waits for all the pages, then calls print_file. Subclasses may override
+        this to produce output incrementally.
+        """
+        for _ in pages:
+            pass
+        yield from self.print_file(filename, document)
+
     def end(self) -> str:
         """Called once after the final print_file call. Returns any final additional output."""
         return ''
@@ -2,7 +2,7 @@ import textwrap
 import typing
 
 from . import Printer
-from ..types import AnnotationType, Pos, Annotation, Document
+from ..types import AnnotationType, Pos, Annotation, Document, Page
 from .. import logger
 
 MAX_CONTEXT_WORDS = 10
@@ -117,7 +117,15 @@ class MarkdownPrinter(Printer):
         filename: str,
         document: Document
     ) -> typing.Iterator[str]:
-        body_iter = self.emit_body(document)
+        yield from self.print_pages(filename, document, iter(document.pages))
+
+    def print_pages(
+        self,
+        filename: str,
+        document: Document,
+        pages: typing.Iterator[Page]
+    ) -> typing.Iterator[str]:
+        body_iter = self.emit_pages(document, pages)
 
         if self.print_filename:
             # Print the file name, only if there is some output.
@@ -254,12 +262,15 @@ class MarkdownPrinter(Printer):
             quotepos = (1, 1) if text else None
             return self.format_bullet(msgparas, quotepos) + "\n\n"
 
-    def emit_body(
+    def emit_pages(
         self,
-        document: Document
+        document: Document,
+        pages: typing.Iterator[Page]
     ) -> typing.Iterator[str]:
-        for a in document.iter_annots():
-            yield self.format_annot(a, document, a.subtype.name)
+        """Emit the body incrementally, as each page of the document is processed."""
+        for page in pages:
+            for a in page.annots:
+                yield self.format_annot(a, document, a.subtype.name)
 
 
 class GroupedMarkdownPrinter(MarkdownPrinter):
@@ -277,6 +288,16 @@ class GroupedMarkdownPrinter(MarkdownPrinter):
         self.sections = sections
         self._fmt_header_called: bool
 
+    def emit_pages(
+        self,
+        document: Document,
+        pages: typing.Iterator[Page]
+    ) -> typing.Iterator[str]:
+        # Grouping needs all of the document's annotations, so wait for all the pages.
+        for _ in pages:
+            pass
+        yield from self.emit_body(document)
+
     def emit_body(
         self,
         document: Document
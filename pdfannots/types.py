@@ -169,29 +169,31 @@ class Pos:
         if isinstance(other, Pos):
             if self.page == other.page:
                 assert self.page is other.page
-                if self.page.fixed_columns:
-                    # Fixed layout: assume left-to-right top-to-bottom documents
-                    (sx, sy) = self.page.mediabox.closest_point((self.x, self.y))
-                    (ox, oy) = self.page.mediabox.closest_point((other.x, other.y))
-                    colwidth = self.page.mediabox.get_width() / self.page.fixed_columns
-                    self_col = (sx - self.page.mediabox.x0) // colwidth
-                    other_col = (ox - self.page.mediabox.x0) // colwidth
-                    return self_col < other_col or (self_col == other_col and sy > oy)
-                else:
-                    # Default layout inferred from pdfminer traversal
-                    assert self._pageseq != 0
-                    assert other._pageseq != 0
-                    if self._pageseq == other._pageseq:
-                        # The positions are on or closest to the same line of text.
-                        # XXX: assume top-to-bottom left-to-right order
-                        return self.x < other.x if self.y == other.y else self.y > other.y
-                    else:
-                        return self._pageseq < other._pageseq
-            else:
-                return self.page < other.page
+            return self.sort_key() < other.sort_key()
         else:
             return NotImplemented
 
+    def sort_key(self) -> typing.Tuple[float, ...]:
+        """
+        Return a key for sorting positions in reading order.
+
+        Comparing the keys of two positions is equivalent to comparing the positions themselves,
+        but sorting by key avoids calling __lt__ for each comparison.
+        """
+        page = self.page
+        if page.fixed_columns:
+            # Fixed layout: assume left-to-right top-to-bottom documents
+            (x, y) = page.mediabox.closest_point((self.x, self.y))
+            colwidth = page.mediabox.get_width() / page.fixed_columns
+            col = (x - page.mediabox.x0) // colwidth
+            return (page.pageno, col, -y)
+        else:
+            # Default layout inferred from pdfminer traversal. Positions with the same sequence
+            # number are on or closest to the same line of text.
+            # XXX: assume top-to-bottom left-to-right order
+            assert self._pageseq != 0
+            return (page.pageno, self._pageseq, -self.y, self.x)
+
     def item_hit(self, item: LTComponent) -> bool:
         """Is this pos within the bounding box of the given PDF component?"""
         return (self.x >= item.x0  # type: ignore [no-any-return]
@@ -226,6 +228,11 @@ class ObjectWithPos:
             return self.pos < other.pos
         return NotImplemented
 
+    def sort_key(self) -> typing.Tuple[float, ...]:
+        """Delegates to Pos.sort_key"""
+        assert self.pos is not None
+        return self.pos.sort_key()
+
     def update_pageseq(self, component: LTComponent, pageseq: int) -> None:
         """Delegates to Pos.update_pageseq"""
         if self.pos is not None:
@@ -286,9 +293,8 @@ class Annotation(ObjectWithPos):
         boxes = []
         if quadpoints is not None:
             assert len(quadpoints) % 8 == 0
-            while quadpoints != []:
-                (x0, y0, x1, y1, x2, y2, x3, y3) = quadpoints[:8]
-                quadpoints = quadpoints[8:]
+            for i in range(0, len(quadpoints), 8):
+                (x0, y0, x1, y1, x2, y2, x3, y3) = quadpoints[i:i + 8]
                 xvals = [x0, x1, x2, x3]
                 yvals = [y0, y1, y2, y3]
                 box = Box(min(xvals), min(yvals), max(xvals), max(yvals))
@@ -2,6 +2,8 @@ import datetime
 import string
 import typing
 
+from pdfminer.utils import PDFDocEncoding
+
 CHARACTER_SUBSTITUTIONS = {
     'ﬀ': 'ff',
     'ﬁ': 'fi',
@@ -15,6 +17,13 @@ CHARACTER_SUBSTITUTIONS = {
     '…': '...',
 }
 
+_CHARACTER_SUBSTITUTIONS_TABLE = str.maketrans(CHARACTER_SUBSTITUTIONS)
+"""Translation table for str.translate, equivalent to CHARACTER_SUBSTITUTIONS."""
+
+_PDFDOC_ENCODING_TABLE = str.maketrans(
+    {chr(i): c for (i, c) in enumerate(PDFDocEncoding) if ord(c) != i})
+"""Translation table from Latin-1 to PDFDocEncoding, for the (few) characters that differ."""
+
 
 def cleanup_text(text: str) -> str:
     """
@@ -22,7 +31,18 @@ def cleanup_text(text: str) -> str:
     """
     if '\r' in text:
         text = text.replace('\r\n', '\n').replace('\r', '\n')
-    return ''.join([CHARACTER_SUBSTITUTIONS.get(c, c) for c in text])
+    return text.translate(_CHARACTER_SUBSTITUTIONS_TABLE)
+
+
+def decode_text(s: bytes) -> str:
+    """
+    Decode a PDF text string, which is either UTF-16BE (with a byte order mark) or PDFDocEncoding.
+
+    Equivalent to pdfminer.utils.decode_text, but decodes PDFDocEncoding using builtin codecs.
+    """
+    if s.startswith(b'\xfe\xff'):
+        return str(s[2:], 'utf-16be', 'ignore')
+    return s.decode('latin-1').translate(_PDFDOC_ENCODING_TABLE)
 
 
 def merge_lines(captured_text: str, remove_hyphens: bool = False, strip_space: bool = True) -> str:
@@ -43,6 +43,9 @@ def main() -> None:
         },
         python_requires='>=3.6',
         install_requires=['pdfminer.six'],
+        extras_require={
+            'fast': ['numpy', 'numba'],
+        },
     )
 
 
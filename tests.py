@@ -1,18 +1,23 @@
 #!/usr/bin/env python3
 
+import concurrent.futures
 import functools
 import json
 import operator
 import pathlib
+import sys
 import typing
 import unittest
+import unittest.mock
 from datetime import datetime, timedelta, timezone
 
 import pdfminer.layout
+import pdfminer.pdfinterp
+import pdfminer.utils
 
 import pdfannots
 import pdfannots.utils
-from pdfannots.types import AnnotationType
+from pdfannots.types import Annotation, AnnotationType, Box, Document, Page
 from pdfannots.printer.markdown import MarkdownPrinter, GroupedMarkdownPrinter
 from pdfannots.printer.json import JsonPrinter
 
@@ -31,6 +36,84 @@ class UnitTests(unittest.TestCase):
             dt = pdfannots.utils.decode_datetime(dts)
             self.assertEqual(dt, expected)
 
+    def test_decode_text(self) -> None:
+        datas = [
+            bytes(range(256)),                        # PDFDocEncoding
+            b'\xfe\xff' + 'Ünïcödé ‘text’'.encode('utf-16be'),  # UTF-16BE with BOM
+            b'',
+        ]
+        for s in datas:
+            self.assertEqual(pdfannots.utils.decode_text(s), pdfminer.utils.decode_text(s))
+
+    def test_cleanup_text(self) -> None:
+        self.assertEqual(pdfannots.utils.cleanup_text('‘ﬁne’…\r\nﬂat\r'), "'fine'...\nflat\n")
+
+    @unittest.skipUnless(pdfannots.HAVE_NUMPY, "requires numpy")
+    def test_hit_indices(self) -> None:
+        import numpy
+        boxes = [Box(0, 0, 10, 10), Box(10, 0, 20, 10), Box(0, 10, 10, 20), Box(5, 0, 15, 10)]
+        items = [
+            (0, 0, 10, 10),    # exactly matches one box, and half overlaps another
+            (0, 0, 20, 10),    # exactly 50% of its area overlaps each of three boxes
+            (10, 10, 20, 20),  # only touches boxes, at their edges and corners
+            (5, 5, 5, 8),      # zero area
+            (2, 2, 12, 8),     # mostly inside two boxes
+        ]
+        (x0, y0, x1, y1) = (numpy.array(c, dtype=numpy.float64)
+                            for c in zip(*(b.get_coords() for b in boxes)))
+        annot_idx = numpy.arange(len(boxes), dtype=numpy.intp)
+        out = numpy.empty(len(boxes), dtype=numpy.intp)
+
+        # Test the pure-Python function, and the function compiled by numba (if available).
+        fns: typing.List[typing.Callable[..., int]] = [pdfannots._hit_indices]
+        jit = pdfannots._get_hit_indices_jit() if pdfannots.HAVE_NUMBA else None
+        if jit is not None:
+            fns.append(jit)
+
+        for fn in fns:
+            for bbox in items:
+                item = pdfminer.layout.LTComponent(bbox)
+                expected = [i for (i, b) in enumerate(boxes) if b.hit_item(item)]
+                n = fn(x0, y0, x1, y1, annot_idx, item.x0, item.y0, item.x1, item.y1,
+                       item.width * item.height, out)
+                self.assertEqual(out[:n].tolist(), expected, bbox)
+
+    def test_hit_test_strategies(self) -> None:
+        page = Page(0, None, (0, 0, 100, 100))
+        for boxes in [[Box(0, 0, 10, 10), Box(10, 0, 20, 10)], [Box(0, 10, 10, 20)],
+                      [Box(5, 0, 15, 10)]]:
+            quadpoints = [c for b in boxes
+                          for c in (b.x0, b.y1, b.x1, b.y1, b.x0, b.y0, b.x1, b.y0)]
+            page.annots.append(Annotation(page, AnnotationType.Highlight, quadpoints=quadpoints))
+        items = [pdfminer.layout.LTComponent(bbox) for bbox in [
+            (0, 0, 10, 10), (0, 0, 20, 10), (10, 10, 20, 20), (5, 5, 5, 8), (2, 2, 12, 8),
+            (12, 2, 18, 8), (50, 50, 60, 60)]]
+
+        device = pdfannots._PDFProcessor(pdfminer.pdfinterp.PDFResourceManager(),
+                                         pdfminer.layout.LAParams())
+        device.set_page(page)
+        expected = [device._test_boxes_loop(item) for item in items]
+
+        # Every other strategy for hit-testing characters should agree with the simple loop.
+        strategies: typing.List[typing.Tuple[str, typing.Callable[[], None]]] = []
+        if pdfannots.HAVE_NUMPY:
+            strategies.append(
+                ('numpy', functools.partial(device._prepare_vectorized, use_numba=False)))
+        if pdfannots.HAVE_NUMBA:
+            strategies.append(
+                ('numba', functools.partial(device._prepare_vectorized, use_numba=True)))
+        if pdfannots.HAVE_RTREE:
+            strategies.append(('rtree', device._prepare_indexed))
+
+        for (name, prepare) in strategies:
+            with self.subTest(name):
+                prepare()
+                actual = []
+                for item in items:
+                    device.test_boxes(item)
+                    actual.append(device._lasthit)
+                self.assertEqual(actual, expected)
+
 
 class ExtractionTestBase(unittest.TestCase):
     filename: str
@@ -39,11 +122,17 @@ class ExtractionTestBase(unittest.TestCase):
     columns_per_page: typing.Optional[int] = None
     laparams = pdfminer.layout.LAParams()
 
+    # Permit a test to skip PDFMiner's layout analysis, or to render pages in parallel
+    fast_layout = False
+    executor: typing.Optional[concurrent.futures.ProcessPoolExecutor] = None
+
     def setUp(self) -> None:
         path = pathlib.Path(__file__).parent / 'tests' / self.filename
         with path.open('rb') as f:
             self.doc = pdfannots.process_file(f, columns_per_page=self.columns_per_page,
-                                              laparams=self.laparams)
+                                              laparams=self.laparams,
+                                              fast_layout=self.fast_layout,
+                                              executor=self.executor)
             self.annots = [a for p in self.doc.pages for a in p.annots]
             self.outlines = [o for p in self.doc.pages for o in p.outlines]
 
@@ -115,6 +204,68 @@ class ExtractionTests(ExtractionTestBase):
         self.assertEqual(o.title, 'Case study: CET')
 
 
+class ParallelExtractionTests(ExtractionTests):
+    """Repeat the above tests, rendering pages in worker processes."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.executor = concurrent.futures.ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        assert cls.executor is not None
+        cls.executor.shutdown()
+
+
+class ExecutorTests(unittest.TestCase):
+    def test_thread_pool_rejected(self) -> None:
+        path = pathlib.Path(__file__).parent / 'tests' / 'hotos17.pdf'
+        with path.open('rb') as f, concurrent.futures.ThreadPoolExecutor() as executor:
+            with self.assertRaises(TypeError):
+                pdfannots.process_file(f, executor=executor)  # type: ignore[arg-type]
+
+
+class FastLayoutExtractionTests(ExtractionTests):
+    """Repeat the above tests, skipping PDFMiner's layout analysis."""
+    fast_layout = True
+
+
+class PurePythonExtractionTests(ExtractionTests):
+    """Repeat the above tests, hit-testing annotation boxes without the optional dependencies."""
+
+    @unittest.mock.patch.multiple(pdfannots, NUMPY_MIN_BOXES=sys.maxsize,
+                                  RTREE_MIN_BOXES=sys.maxsize)
+    def setUp(self) -> None:
+        super().setUp()
+
+
+@unittest.skipUnless(pdfannots.HAVE_NUMPY, "requires numpy")
+class VectorizedExtractionTests(ExtractionTests):
+    """Repeat the above tests, hit-testing annotation boxes with numpy, but not numba."""
+
+    @unittest.mock.patch.multiple(pdfannots, NUMPY_MIN_BOXES=1, NUMBA_MIN_HIT_TESTS=sys.maxsize)
+    def setUp(self) -> None:
+        super().setUp()
+
+
+@unittest.skipUnless(pdfannots.HAVE_NUMBA, "requires numba")
+class CompiledExtractionTests(ExtractionTests):
+    """Repeat the above tests, hit-testing annotation boxes with numba."""
+
+    @unittest.mock.patch.multiple(pdfannots, NUMPY_MIN_BOXES=1, NUMBA_MIN_HIT_TESTS=0)
+    def setUp(self) -> None:
+        super().setUp()
+
+
+@unittest.skipUnless(pdfannots.HAVE_RTREE, "requires rtree")
+class IndexedExtractionTests(ExtractionTests):
+    """Repeat the above tests, using a spatial index for annotation boxes on every page."""
+
+    @unittest.mock.patch.multiple(pdfannots, NUMPY_MIN_BOXES=sys.maxsize, RTREE_MIN_BOXES=1)
+    def setUp(self) -> None:
+        super().setUp()
+
+
 class Issue9(ExtractionTestBase):
     filename = 'issue9.pdf'
 
@@ -280,6 +431,18 @@ class MarkdownPrinterTest(PrinterTestBase):
         self.assertGreater(linecount, 10)
         self.assertGreater(charcount, 900)
 
+    def test_incremental(self) -> None:
+        path = pathlib.Path(__file__).parent / 'tests' / self.filename
+        for p in (MarkdownPrinter(), GroupedMarkdownPrinter()):
+            expected = ''.join(p.print_file('dummyfile', self.doc))
+
+            doc = Document()
+            with path.open('rb') as f:
+                pages = pdfannots.iter_pages(f, doc)
+                actual = ''.join(p.print_pages('dummyfile', doc, pages))
+
+            self.assertEqual(actual, expected)
+
 
 class JsonPrinterTest(PrinterTestBase):
     def test_flat(self) -> None: